@@ -7,6 +7,7 @@ Core simulation components for warehouse robot simulation.
 __version__ = "1.0.0"
 __author__ = "GitMVP"
 
+from .config import WarehouseConfig
 from .instance import Instance
 from .bot import Bot
 from .pod import Pod
@@ -15,6 +16,7 @@ from .station import InputStation, OutputStation
 from .simulator import SimulationExecutor
 
 __all__ = [
+    'WarehouseConfig',
     'Instance',
     'Bot',
     'Pod',
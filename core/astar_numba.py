@@ -0,0 +1,127 @@
+"""
+A* Kernel - Array-based A* Pathfinding
+
+Implements A* over the NumPy waypoint graph built by Instance.generate_layout,
+compiled with Numba when it is installed. The compiled kernel releases the GIL,
+so independent searches can run in parallel threads.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, nogil=True)
+def _heap_push(heap_f, heap_node, size, f, node):
+    """Push (f, node) onto the binary heap stored in parallel arrays."""
+    i = size
+    heap_f[i] = f
+    heap_node[i] = node
+    while i > 0:
+        parent = (i - 1) // 2
+        if heap_f[i] < heap_f[parent] or (heap_f[i] == heap_f[parent] and heap_node[i] < heap_node[parent]):
+            heap_f[i], heap_f[parent] = heap_f[parent], heap_f[i]
+            heap_node[i], heap_node[parent] = heap_node[parent], heap_node[i]
+            i = parent
+        else:
+            break
+    return size + 1
+
+
+@njit(cache=True, nogil=True)
+def _heap_pop(heap_f, heap_node, size):
+    """Remove the smallest entry from the heap (read it from index 0 first)."""
+    size -= 1
+    heap_f[0] = heap_f[size]
+    heap_node[0] = heap_node[size]
+    i = 0
+    while True:
+        left = 2 * i + 1
+        if left >= size:
+            break
+        child = left
+        right = left + 1
+        if right < size and (heap_f[right] < heap_f[left] or
+                             (heap_f[right] == heap_f[left] and heap_node[right] < heap_node[left])):
+            child = right
+        if heap_f[child] < heap_f[i] or (heap_f[child] == heap_f[i] and heap_node[child] < heap_node[i]):
+            heap_f[i], heap_f[child] = heap_f[child], heap_f[i]
+            heap_node[i], heap_node[child] = heap_node[child], heap_node[i]
+            i = child
+        else:
+            break
+    return size
+
+
+@njit(cache=True, nogil=True)
+def astar(start, goal, nbr_offsets, nbr_idx, nbr_cost, blocked, xs, ys):
+    """Find the shortest path from start to goal as an array of waypoint ids.
+
+    The graph is in CSR form: the neighbors of waypoint i are
+    nbr_idx[nbr_offsets[i]:nbr_offsets[i + 1]], with edge lengths in nbr_cost
+    at the same positions. Blocked waypoints are skipped unless they are the
+    goal. Ties on f-score are broken by waypoint id, so results match
+    AStar.search_python. Returns an empty array if no path exists.
+    """
+    if start == goal:
+        return np.array([start], dtype=np.int32)
+
+    n = nbr_offsets.shape[0] - 1
+    g_score = np.full(n, np.inf)
+    came_from = np.full(n, -1, dtype=np.int32)
+    closed = np.zeros(n, dtype=np.bool_)
+
+    # Every push follows an edge relaxation, so the heap never exceeds |E| + 1
+    capacity = nbr_idx.shape[0] + 1
+    heap_f = np.empty(capacity, dtype=np.float64)
+    heap_node = np.empty(capacity, dtype=np.int32)
+
+    goal_x = xs[goal]
+    goal_y = ys[goal]
+    g_score[start] = 0.0
+    size = _heap_push(heap_f, heap_node, 0, 0.0, start)
+
+    while size > 0:
+        current = heap_node[0]
+        size = _heap_pop(heap_f, heap_node, size)
+
+        if closed[current]:
+            continue
+        closed[current] = True
+
+        if current == goal:
+            length = 1
+            node = goal
+            while node != start:
+                node = came_from[node]
+                length += 1
+            path = np.empty(length, dtype=np.int32)
+            node = goal
+            for i in range(length - 1, -1, -1):
+                path[i] = node
+                node = came_from[node]
+            return path
+
+        for k in range(nbr_offsets[current], nbr_offsets[current + 1]):
+            neighbor = nbr_idx[k]
+            if closed[neighbor] or (blocked[neighbor] and neighbor != goal):
+                continue
+
+            tentative_g_score = g_score[current] + nbr_cost[k]
+            if tentative_g_score < g_score[neighbor]:
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                f = tentative_g_score + abs(xs[neighbor] - goal_x) + abs(ys[neighbor] - goal_y)
+                size = _heap_push(heap_f, heap_node, size, f, neighbor)
+
+    return np.empty(0, dtype=np.int32)
@@ -7,8 +7,6 @@ Implements robot movement, pathfinding, and task execution.
 import math
 from typing import Optional, List, TYPE_CHECKING
 
-from .pathfinding import AStar
-
 if TYPE_CHECKING:
     from .instance import Instance
     from .waypoint import Waypoint
@@ -16,14 +14,54 @@ if TYPE_CHECKING:
     from .station import OutputStation
 
 
+# Bot states (values of Bot.state / Instance.bot_state)
+IDLE = 0
+MOVING = 1
+PICKING = 2
+DROPPING = 3
+BOT_STATE_NAMES = ('idle', 'moving', 'picking', 'dropping')
+
+
+class _BotArrayField:
+    """Attribute stored in one of the instance's per-bot arrays (indexed by bot id)."""
+
+    def __init__(self, array_name: str):
+        self.array_name = array_name
+
+    def __get__(self, bot: 'Bot', owner=None):
+        if bot is None:
+            return self
+        return getattr(bot.instance, self.array_name)[bot.id]
+
+    def __set__(self, bot: 'Bot', value):
+        getattr(bot.instance, self.array_name)[bot.id] = value
+
+
 class Bot:
-    """Autonomous warehouse robot."""
+    """Autonomous warehouse robot.
+
+    Kinematic state and statistics live in NumPy arrays on the instance so
+    that Instance.update can advance all bots in one vectorized step.
+    """
+
+    __slots__ = ('id', 'instance', 'current_waypoint', 'path', 'path_index', 'carrying_pod',
+                 'current_task', 'target_pod', 'target_station', 'storage_waypoint')
+
+    x = _BotArrayField('bot_x')
+    y = _BotArrayField('bot_y')
+    target_x = _BotArrayField('bot_target_x')
+    target_y = _BotArrayField('bot_target_y')
+    speed = _BotArrayField('bot_speed')
+    state = _BotArrayField('bot_state')
+    busy_time = _BotArrayField('bot_busy_time')
+    idle_time = _BotArrayField('bot_idle_time')
+    distance_traveled = _BotArrayField('bot_distance')
 
     def __init__(self, bot_id: int, speed: float, instance: 'Instance'):
         """Initialize a bot."""
         self.id = bot_id
-        self.speed = speed
         self.instance = instance
+        self.speed = speed
 
         # Position
         self.x = 0.0
@@ -37,52 +75,57 @@ class Bot:
         self.target_y = 0.0
 
         # State
-        self.state = 'idle'  # idle, moving, picking, dropping
+        self.state = IDLE  # IDLE, MOVING, PICKING, DROPPING
         self.carrying_pod: Optional['Pod'] = None
 
         # Task
         self.current_task = None
         self.target_pod: Optional['Pod'] = None
         self.target_station: Optional['OutputStation'] = None
+        self.storage_waypoint: Optional['Waypoint'] = None
 
         # Statistics
         self.busy_time = 0.0
         self.idle_time = 0.0
         self.distance_traveled = 0.0
 
-    def assign_task(self, task_type: str, pod: 'Pod', station: 'OutputStation'):
-        """Assign a task to this bot."""
+    def assign_task(self, task_type: str, pod: 'Pod', station: 'OutputStation',
+                    path: Optional[List['Waypoint']] = None):
+        """Assign a task to this bot.
+
+        A path to the pod that was already planned (see Instance.assign_tasks)
+        can be passed in; otherwise it is calculated here.
+        """
         self.current_task = task_type
         self.target_pod = pod
         self.target_station = station
-        self.state = 'moving'
+        self.state = MOVING
 
         # Calculate path to pod
-        if pod.waypoint:
+        if path is not None:
+            self.set_path(path)
+        elif pod.waypoint:
             self.calculate_path(pod.waypoint)
 
     def calculate_path(self, destination: 'Waypoint'):
         """Calculate A* path to destination."""
         if self.current_waypoint:
-            pathfinder = AStar(self.instance)
-            self.path = pathfinder.find_path(self.current_waypoint, destination)
-            self.path_index = 0
-
-            if self.path:
-                # Set first target
-                next_wp = self.path[self.path_index]
-                self.target_x = next_wp.x
-                self.target_y = next_wp.y
+            self.set_path(self.instance.pathfinder.find_path(self.current_waypoint, destination))
 
-    def update(self, delta_time: float):
-        """Update bot state."""
-        if self.state == 'idle':
-            self.idle_time += delta_time
-            return
+    def set_path(self, path: List['Waypoint']):
+        """Start following a path (starting at the current waypoint)."""
+        self.path = path
+        self.path_index = 0
 
-        if self.state == 'moving':
-            self.busy_time += delta_time
-            self.move(delta_time)
+        if self.path:
+            # Set first target
+            next_wp = self.path[self.path_index]
+            self.target_x = next_wp.x
+            self.target_y = next_wp.y
+        else:
+            # Hold position so the vectorized step leaves the bot in place
+            self.target_x = self.x
+            self.target_y = self.y
 
     def move(self, delta_time: float):
         """Move bot towards target."""
@@ -90,12 +133,12 @@ class Bot:
             self.on_destination_reached()
             return
 
-        # Calculate distance to target waypoint
+        # Calculate squared distance to target waypoint
         dx = self.target_x - self.x
         dy = self.target_y - self.y
-        distance = math.sqrt(dx * dx + dy * dy)
+        distance_sq = dx * dx + dy * dy
 
-        if distance < 0.1:  # Reached waypoint
+        if distance_sq < 0.01:  # Reached waypoint (distance < 0.1)
             # Snap to waypoint
             self.x = self.target_x
             self.y = self.target_y
@@ -111,6 +154,7 @@ class Bot:
                 self.on_destination_reached()
         else:
             # Move towards target
+            distance = math.sqrt(distance_sq)
             move_distance = self.speed * delta_time
             if move_distance > distance:
                 move_distance = distance
@@ -132,7 +176,8 @@ class Bot:
         """Handle reaching destination waypoint."""
         if self.current_task == 'fetch_pod':
             if self.target_pod and not self.carrying_pod:
-                # Pick up pod
+                # Pick up pod (remember where it has to be returned to)
+                self.storage_waypoint = self.target_pod.waypoint
                 self.pick_up_pod(self.target_pod)
                 # Navigate to station
                 if self.target_station:
@@ -143,9 +188,9 @@ class Bot:
                 # Complete order
                 self.instance.complete_order(self)
                 # Return pod to storage
-                if self.target_pod and self.target_pod.waypoint:
+                if self.target_pod and self.storage_waypoint:
                     self.pick_up_pod(self.target_pod)
-                    self.calculate_path(self.target_pod.waypoint)
+                    self.calculate_path(self.storage_waypoint)
                     self.current_task = 'return_pod'
             else:
                 # Task complete
@@ -158,15 +203,23 @@ class Bot:
     def pick_up_pod(self, pod: 'Pod'):
         """Pick up a pod."""
         self.carrying_pod = pod
+        self.instance.bot_pod[self.id] = pod.id
         pod.in_use = True
         pod.bot = self
         if pod.waypoint:
+            self.instance.blocked[pod.waypoint.id] = False
             pod.waypoint.pod = None
             pod.waypoint = None
+        self.instance.invalidate_blocked_state()
 
     def drop_pod(self):
         """Drop the carried pod at current location."""
         if self.carrying_pod and self.current_waypoint:
+            previous = self.carrying_pod.waypoint
+            if previous:
+                # Pod was put down elsewhere meanwhile (by another bot sent for it)
+                previous.pod = None
+                self.instance.blocked[previous.id] = False
             self.carrying_pod.waypoint = self.current_waypoint
             self.current_waypoint.pod = self.carrying_pod
             self.carrying_pod.x = self.current_waypoint.x
@@ -174,12 +227,20 @@ class Bot:
             self.carrying_pod.in_use = False
             self.carrying_pod.bot = None
             self.carrying_pod = None
+            self.instance.bot_pod[self.id] = -1
+            self.instance.blocked[self.current_waypoint.id] = True
+            self.instance.invalidate_blocked_state()
 
     def complete_task(self):
         """Complete current task and return to idle."""
         self.current_task = None
         self.target_pod = None
         self.target_station = None
-        self.state = 'idle'
+        self.storage_waypoint = None
+        self.state = IDLE
         self.path = []
-        self.path_index = 0
\ No newline at end of file
+        self.path_index = 0
+        self.instance.idle_bots.append(self)
+
+    def __repr__(self):
+        return f"Bot{self.id}({BOT_STATE_NAMES[self.state]})"
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""
+Config - Simulation Configuration
+
+Typed, read-only view of the JSON configuration. Each section of the file
+maps to a frozen dataclass; the defaults match the built-in configuration.
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Optional, Union, get_args, get_origin
+
+try:
+    import msgspec  # Optional: validates and converts in one pass
+except ImportError:
+    msgspec = None
+
+
+@dataclass(frozen=True)
+class WarehouseSpec:
+    """Warehouse grid dimensions."""
+    width: int = 30
+    height: int = 20
+    pod_storage_rows: int = 5
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class RobotSpec:
+    """Robot fleet (speed in units/second)."""
+    count: int = 8
+    speed: float = 2.0
+    capacity: int = 1
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class PodSpec:
+    """Storage pods (capacity in arbitrary weight units)."""
+    count: int = 40
+    capacity: float = 100.0
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class StationSpec:
+    """Input/output stations."""
+    input_count: int = 2
+    output_count: int = 2
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class SimulationSpec:
+    """Simulation parameters (all times in seconds)."""
+    duration: float = 300
+    warmup_time: float = 10
+    time_step: float = 0.1
+    seed: Optional[int] = None
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class WarehouseConfig:
+    """Complete simulation configuration."""
+    warehouse: WarehouseSpec = field(default_factory=WarehouseSpec)
+    robots: RobotSpec = field(default_factory=RobotSpec)
+    pods: PodSpec = field(default_factory=PodSpec)
+    stations: StationSpec = field(default_factory=StationSpec)
+    simulation: SimulationSpec = field(default_factory=SimulationSpec)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'WarehouseConfig':
+        """Build a config from parsed JSON (missing sections/keys use defaults).
+
+        Raises TypeError for unknown sections or keys and for values of the
+        wrong type (e.g. a string width or a fractional robot count).
+        """
+        if not isinstance(data, dict):
+            raise TypeError("config must be a JSON object")
+        unknown = set(data) - set(_SECTIONS)
+        if unknown:
+            raise TypeError(f"unknown config section(s): {', '.join(sorted(unknown))}")
+        for name, spec in _SECTIONS.items():
+            section = data.get(name, {})
+            if not isinstance(section, dict):
+                raise TypeError(f"config section '{name}' must be a JSON object")
+            unknown = set(section) - {f.name for f in fields(spec)}
+            if unknown:
+                raise TypeError(f"unknown key(s) in '{name}': {', '.join(sorted(unknown))}")
+
+        if msgspec is not None:
+            try:
+                return msgspec.convert(data, cls)
+            except msgspec.ValidationError as e:
+                raise TypeError(str(e)) from e
+
+        for name, spec in _SECTIONS.items():
+            types = {f.name: f.type for f in fields(spec)}
+            for key, value in data.get(name, {}).items():
+                if not _is_instance(value, types[key]):
+                    raise TypeError(f"Expected `{_type_name(types[key])}`, got "
+                                    f"`{type(value).__name__}` - at `$.{name}.{key}`")
+        return cls(**{name: spec(**data[name]) for name, spec in _SECTIONS.items() if name in data})
+
+
+_SECTIONS = {
+    'warehouse': WarehouseSpec,
+    'robots': RobotSpec,
+    'pods': PodSpec,
+    'stations': StationSpec,
+    'simulation': SimulationSpec,
+}
+
+
+def _is_instance(value, tp) -> bool:
+    """Check a JSON value against a field type (int is accepted for float, bool is not a number)."""
+    if get_origin(tp) is Union:
+        return any(_is_instance(value, arg) for arg in get_args(tp))
+    if tp is type(None):
+        return value is None
+    if isinstance(value, bool):
+        return tp is bool
+    if tp is float:
+        return isinstance(value, (int, float))
+    return isinstance(value, tp)
+
+
+def _type_name(tp) -> str:
+    """Readable name of a field type for error messages."""
+    if get_origin(tp) is Union:
+        return ' | '.join(_type_name(arg) for arg in get_args(tp))
+    return 'null' if tp is type(None) else tp.__name__
@@ -5,20 +5,30 @@ Represents a complete warehouse simulation instance with all elements.
 """
 
 import random
-from typing import List, Dict, Optional
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Union
 import time
 
-from .bot import Bot
+import numpy as np
+
+from .bot import Bot, IDLE, MOVING
 from .pod import Pod
 from .waypoint import Waypoint
 from .station import InputStation, OutputStation
+from .pathfinding import AStar
+from .config import WarehouseConfig
+from .astar_numba import NUMBA_AVAILABLE
+from .motion_numba import advance_bots
 
 
 class Instance:
     """Main simulation instance containing all warehouse elements."""
 
-    def __init__(self, config: dict):
-        """Initialize the simulation instance."""
+    def __init__(self, config: Union[WarehouseConfig, dict]):
+        """Initialize the simulation instance (a plain config dict is converted)."""
+        if isinstance(config, dict):
+            config = WarehouseConfig.from_dict(config)
         self.config = config
         self.name = "RAWSim-O-MVP"
 
@@ -31,10 +41,59 @@ class Instance:
 
         # Waypoint grid for easy access
         self.waypoint_grid: Dict[tuple, Waypoint] = {}
+        self.grid: Optional[np.ndarray] = None  # [width, height] Waypoint objects
+        self.storage_waypoints: List[Waypoint] = []
+
+        # Waypoints blocked by stored pods, indexed by waypoint id (kept up to
+        # date by Bot.pick_up_pod / Bot.drop_pod)
+        self.blocked: Optional[np.ndarray] = None
+        self._blocked_state: Optional[frozenset] = None
+
+        # Shared pathfinder (caches paths per blocked-waypoint state)
+        self.pathfinder = AStar(self)
+        # Threads for parallel path searches, created on first use by
+        # AStar.find_paths (only with Numba); released by close()
+        self.path_pool: Optional[ThreadPoolExecutor] = None
+
+        # Array form of the waypoint graph (built by generate_layout)
+        # CSR adjacency: neighbors of waypoint i are nbr_idx[nbr_offsets[i]:nbr_offsets[i + 1]]
+        self.nbr_offsets: Optional[np.ndarray] = None  # [N + 1]
+        self.nbr_idx: Optional[np.ndarray] = None  # [E] neighbor ids
+        self.nbr_cost: Optional[np.ndarray] = None  # [E] edge lengths
+        self.waypoint_x: Optional[np.ndarray] = None
+        self.waypoint_y: Optional[np.ndarray] = None
+
+        # Bot kinematics and statistics as arrays indexed by bot id (see Bot)
+        bot_count = config.robots.count
+        self.bot_x = np.zeros(bot_count)
+        self.bot_y = np.zeros(bot_count)
+        self.bot_target_x = np.zeros(bot_count)
+        self.bot_target_y = np.zeros(bot_count)
+        self.bot_speed = np.zeros(bot_count)
+        self.bot_state = np.zeros(bot_count, dtype=np.int8)
+        self.bot_busy_time = np.zeros(bot_count)
+        self.bot_idle_time = np.zeros(bot_count)
+        self.bot_distance = np.zeros(bot_count)
+        self.bot_pod = np.full(bot_count, -1, dtype=np.int32)  # id of carried pod, -1 if none
+        self._arrivals = np.empty(bot_count, dtype=np.int32)  # scratch output of advance_bots
+
+        # Pod positions and state as arrays indexed by pod id (see Pod)
+        pod_count = config.pods.count
+        self.pod_x = np.zeros(pod_count)
+        self.pod_y = np.zeros(pod_count)
+        self.pod_in_use = np.zeros(pod_count, dtype=np.bool_)
+
+        # Random numbers for order generation, drawn from NumPy in batches
+        self._rng = np.random.default_rng(config.simulation.seed)
+        # Layout randomness (pod placement and contents, bot spawn cells);
+        # seeded too, so a seed reproduces the whole run
+        self._layout_random = random.Random(config.simulation.seed)
+        self._rand_buf = self._rng.random(65536)
+        self._rand_i = 0
 
         # Simulation state
         self.current_time = 0.0
-        self.time_step = config['simulation'].get('time_step', 0.1)
+        self.time_step = config.simulation.time_step
         self.running = False
         self.paused = False
 
@@ -49,110 +108,152 @@ class Instance:
             'end_time': None
         }
 
+        # Item ids: item names are interned once so pods store dense count arrays
+        self.item_vocab: Dict[str, int] = {}
+        self.item_names: List[str] = []
+
+        # Inverted inventory index: {item_id: {pod: None}} (insertion-ordered set)
+        self.item_to_pods: Dict[int, Dict[Pod, None]] = defaultdict(dict)
+
         # Pending orders (simplified)
-        self.pending_orders = []
+        self.pending_orders: deque = deque()
         self.active_tasks = {}
 
+        # Idle robots waiting for a task (filled by generate_layout and Bot.complete_task)
+        self.idle_bots: deque = deque()
+
     def generate_layout(self):
         """Generate warehouse layout from configuration."""
-        warehouse_cfg = self.config['warehouse']
-        width = warehouse_cfg['width']
-        height = warehouse_cfg['height']
+        warehouse_cfg = self.config.warehouse
+        width = warehouse_cfg.width
+        height = warehouse_cfg.height
+
+        station_cfg = self.config.stations
+        input_spacing = width // (station_cfg.input_count + 1)
+        output_spacing = width // (station_cfg.output_count + 1)
+        station_cells = ({(input_spacing * (i + 1), 0) for i in range(station_cfg.input_count)} |
+                         {(output_spacing * (i + 1), height - 1) for i in range(station_cfg.output_count)})
+
+        # Pod storage locations (middle section)
+        storage_rows = warehouse_cfg.pod_storage_rows
+        storage_y_start = height // 2 - storage_rows // 2
+        storage_y_end = storage_y_start + storage_rows
 
         print("Generating waypoint grid...")
-        # Create waypoint grid
+        # Create waypoint grid, marking storage locations and collecting
+        # free (non-storage, non-station) waypoints in the same pass
+        grid = np.empty((width, height), dtype=object)
+        storage_waypoints = []
+        free_waypoints = []
         wp_id = 0
         for y in range(height):
+            storage_row = storage_y_start <= y < storage_y_end
             for x in range(width):
                 wp = Waypoint(wp_id, x, y, self)
                 self.waypoints.append(wp)
                 self.waypoint_grid[(x, y)] = wp
+                grid[x, y] = wp
                 wp_id += 1
 
-        # Connect waypoints (4-directional)
-        for wp in self.waypoints:
-            x, y = wp.x, wp.y
-            # Right
-            if (x + 1, y) in self.waypoint_grid:
-                wp.add_path(self.waypoint_grid[(x + 1, y)])
-            # Down
-            if (x, y + 1) in self.waypoint_grid:
-                wp.add_path(self.waypoint_grid[(x, y + 1)])
-            # Left
-            if (x - 1, y) in self.waypoint_grid:
-                wp.add_path(self.waypoint_grid[(x - 1, y)])
-            # Up
-            if (x, y - 1) in self.waypoint_grid:
-                wp.add_path(self.waypoint_grid[(x, y - 1)])
+                # Leave aisles on sides and every 3 columns
+                if storage_row and 2 <= x < width - 2 and x % 3 != 0:
+                    wp.pod_storage_location = True
+                    storage_waypoints.append(wp)
+                elif (x, y) not in station_cells:
+                    free_waypoints.append(wp)
+        self.grid = grid
+        self.storage_waypoints = list(storage_waypoints)
+
+        self.blocked = np.zeros(len(self.waypoints), dtype=np.bool_)
+
+        # Connect waypoints (4-directional); each undirected edge is visited
+        # once via its Right/Down end and added in both directions
+        for y in range(height):
+            for x in range(width):
+                wp = grid[x, y]
+                # Right (and Left back)
+                if x + 1 < width:
+                    wp.connect(grid[x + 1, y])
+                # Down (and Up back)
+                if y + 1 < height:
+                    wp.connect(grid[x, y + 1])
+
+        self.build_graph_arrays()
 
         print("Placing stations...")
         # Place input stations (top of warehouse)
-        station_cfg = self.config['stations']
-        input_spacing = width // (station_cfg['input_count'] + 1)
-        for i in range(station_cfg['input_count']):
+        for i in range(station_cfg.input_count):
             x = input_spacing * (i + 1)
             y = 0
-            wp = self.waypoint_grid[(x, y)]
+            wp = grid[x, y]
             station = InputStation(i, wp, self)
             self.input_stations.append(station)
             wp.input_station = station
 
         # Place output stations (bottom of warehouse)
-        output_spacing = width // (station_cfg['output_count'] + 1)
-        for i in range(station_cfg['output_count']):
+        for i in range(station_cfg.output_count):
             x = output_spacing * (i + 1)
             y = height - 1
-            wp = self.waypoint_grid[(x, y)]
+            wp = grid[x, y]
             station = OutputStation(i, wp, self)
             self.output_stations.append(station)
             wp.output_station = station
 
-        print("Creating pod storage locations...")
-        # Mark pod storage locations (middle section)
-        storage_rows = warehouse_cfg.get('pod_storage_rows', 5)
-        storage_y_start = height // 2 - storage_rows // 2
-        storage_y_end = storage_y_start + storage_rows
-
-        for y in range(storage_y_start, storage_y_end):
-            for x in range(2, width - 2):  # Leave aisles on sides
-                if x % 3 != 0:  # Leave aisles every 3 columns
-                    wp = self.waypoint_grid[(x, y)]
-                    wp.pod_storage_location = True
-
         print("Initializing pods...")
         # Create pods and place them at storage locations
-        pod_cfg = self.config['pods']
-        storage_waypoints = [wp for wp in self.waypoints if wp.pod_storage_location]
-        random.shuffle(storage_waypoints)
+        pod_cfg = self.config.pods
+        self._layout_random.shuffle(storage_waypoints)
+        pod_count = min(pod_cfg.count, len(storage_waypoints))
 
-        for i in range(min(pod_cfg['count'], len(storage_waypoints))):
-            pod = Pod(i, pod_cfg['capacity'], self)
+        for i in range(pod_count):
+            pod = Pod(i, pod_cfg.capacity, self)
             wp = storage_waypoints[i]
             pod.waypoint = wp
             wp.pod = pod
+            self.blocked[wp.id] = True
             pod.x = wp.x
             pod.y = wp.y
             # Add some random items to pods
-            for _ in range(random.randint(5, 20)):
-                pod.add_item(f"item_{random.randint(1, 50)}")
+            for _ in range(self._layout_random.randint(5, 20)):
+                pod.add_item(f"item_{self._layout_random.randint(1, 50)}")
             self.pods.append(pod)
 
+        # Storage locations left without a pod are free as well
+        free_waypoints.extend(wp for wp in storage_waypoints[pod_count:]
+                              if (wp.x, wp.y) not in station_cells)
+
         print("Spawning robots...")
         # Create robots and place them at random free waypoints
-        robot_cfg = self.config['robots']
-        free_waypoints = [wp for wp in self.waypoints if not wp.pod and not wp.input_station and not wp.output_station]
-        random.shuffle(free_waypoints)
+        robot_cfg = self.config.robots
+        self._layout_random.shuffle(free_waypoints)
 
-        for i in range(min(robot_cfg['count'], len(free_waypoints))):
-            bot = Bot(i, robot_cfg['speed'], self)
+        for i in range(min(robot_cfg.count, len(free_waypoints))):
+            bot = Bot(i, robot_cfg.speed, self)
             wp = free_waypoints[i]
             bot.current_waypoint = wp
-            bot.x = wp.x
-            bot.y = wp.y
+            bot.x = bot.target_x = wp.x
+            bot.y = bot.target_y = wp.y
             self.bots.append(bot)
+            self.idle_bots.append(bot)
 
         print(f"Layout generation complete! ({len(self.waypoints)} waypoints, {len(self.pods)} pods, {len(self.bots)} robots)")
 
+    def build_graph_arrays(self):
+        """Build the CSR (NumPy) representation of the waypoint graph used by A*."""
+        n = len(self.waypoints)
+        self.nbr_offsets = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum([len(wp.paths) for wp in self.waypoints], out=self.nbr_offsets[1:])
+        edge_count = int(self.nbr_offsets[-1])
+        self.nbr_idx = np.fromiter((other.id for wp in self.waypoints for other in wp.paths),
+                                   dtype=np.int32, count=edge_count)
+        self.nbr_cost = np.fromiter((wp.path_distances[other] for wp in self.waypoints for other in wp.paths),
+                                    dtype=np.float32, count=edge_count)
+        self.waypoint_x = np.array([wp.x for wp in self.waypoints], dtype=np.float64)
+        self.waypoint_y = np.array([wp.y for wp in self.waypoints], dtype=np.float64)
+
+        # Paths and graph copies held by the pathfinder refer to the old graph
+        self.pathfinder.clear_cache()
+
     def update(self, delta_time: float):
         """Update simulation state."""
         if self.paused:
@@ -161,51 +262,145 @@ class Instance:
         self.current_time += delta_time
 
         # Update all bots
-        for bot in self.bots:
-            bot.update(delta_time)
+        self._advance_bots(delta_time)
 
         # Simple order generation (random)
-        if random.random() < 0.05:  # 5% chance per update
+        if self._urand() < 0.05:  # 5% chance per update
             self.generate_random_order()
 
         # Assign tasks to idle bots
-        self.assign_tasks()
+        if self.pending_orders and self.idle_bots:
+            self.assign_tasks()
+
+    def _advance_bots(self, delta_time: float):
+        """Advance all bots by one time step (vectorized equivalent of Bot.update)."""
+        if NUMBA_AVAILABLE:
+            moved, n_arrivals = advance_bots(
+                self.bot_state, self.bot_x, self.bot_y, self.bot_target_x, self.bot_target_y,
+                self.bot_speed, self.bot_busy_time, self.bot_idle_time, self.bot_distance,
+                self.bot_pod, self.pod_x, self.pod_y, delta_time, self._arrivals)
+            self.stats['total_distance_traveled'] += moved
+
+            # Waypoint arrivals and path ends are handled per bot
+            for i in self._arrivals[:n_arrivals].tolist():
+                self.bots[i].move(delta_time)
+            return
+
+        idle = self.bot_state == IDLE
+        moving = self.bot_state == MOVING
+        self.bot_idle_time[idle] += delta_time
+        self.bot_busy_time[moving] += delta_time
+
+        dx = self.bot_target_x - self.bot_x
+        dy = self.bot_target_y - self.bot_y
+        advancing = moving & (dx * dx + dy * dy >= 0.01)
+
+        if advancing.any():
+            dx = dx[advancing]
+            dy = dy[advancing]
+            dist = np.hypot(dx, dy)
+            step = np.minimum(self.bot_speed[advancing] * delta_time, dist)
+            self.bot_x[advancing] += (dx / dist) * step
+            self.bot_y[advancing] += (dy / dist) * step
+            self.bot_distance[advancing] += step
+            self.stats['total_distance_traveled'] += float(step.sum())
+
+            # Carried pods follow their bots
+            carriers = advancing & (self.bot_pod >= 0)
+            carried = self.bot_pod[carriers]
+            self.pod_x[carried] = self.bot_x[carriers]
+            self.pod_y[carried] = self.bot_y[carriers]
+
+        # Waypoint arrivals and path ends are handled per bot
+        for i in np.flatnonzero(moving & ~advancing).tolist():
+            self.bots[i].move(delta_time)
+
+    def _urand(self) -> float:
+        """Get the next uniform random number in [0, 1) from the pre-drawn buffer."""
+        value = self._rand_buf[self._rand_i]
+        self._rand_i += 1
+        if self._rand_i == len(self._rand_buf):
+            self._rand_buf = self._rng.random(len(self._rand_buf))
+            self._rand_i = 0
+        return value
 
     def generate_random_order(self):
         """Generate a random order for testing."""
-        items = [f"item_{random.randint(1, 50)}" for _ in range(random.randint(1, 3))]
+        item_ids = self._rng.integers(1, 51, size=self._rng.integers(1, 4))
+        items = [f"item_{i}" for i in item_ids.tolist()]
         order = {
             'id': len(self.pending_orders),
             'items': items,
-            'station': random.choice(self.output_stations) if self.output_stations else None
+            'station': (self.output_stations[self._rng.integers(len(self.output_stations))]
+                        if self.output_stations else None)
         }
         self.pending_orders.append(order)
 
     def assign_tasks(self):
         """Assign pending orders to idle robots."""
-        idle_bots = [bot for bot in self.bots if bot.state == 'idle']
-
-        for bot in idle_bots:
+        # Each idle bot takes at most one order per call; bots whose order
+        # cannot be served go back to the end of the queue
+        assignments = []
+        for _ in range(len(self.idle_bots)):
             if not self.pending_orders:
                 break
 
-            order = self.pending_orders.pop(0)
+            bot = self.idle_bots.popleft()
+            order = self.pending_orders.popleft()
             # Find a pod containing requested items
             suitable_pod = self.find_pod_with_items(order['items'])
 
             if suitable_pod and order['station']:
-                # Assign task to bot
-                bot.assign_task('fetch_pod', suitable_pod, order['station'])
-                self.active_tasks[bot.id] = order
+                assignments.append((bot, suitable_pod, order))
+            else:
+                self.idle_bots.append(bot)
+
+        # Plan all paths to the pods together (in parallel where possible)
+        routed = [(bot, pod) for bot, pod, _ in assignments if bot.current_waypoint and pod.waypoint]
+        paths = self.pathfinder.find_paths([(bot.current_waypoint, pod.waypoint) for bot, pod in routed])
+        planned = {bot.id: path for (bot, _), path in zip(routed, paths)}
+
+        for bot, pod, order in assignments:
+            # Assign task to bot
+            bot.assign_task('fetch_pod', pod, order['station'], planned.get(bot.id))
+            self.active_tasks[bot.id] = order
+
+    def get_blocked_state(self) -> frozenset:
+        """Get the ids of waypoints currently blocked by stored pods."""
+        if self._blocked_state is None:
+            self._blocked_state = frozenset(np.flatnonzero(self.blocked).tolist())
+        return self._blocked_state
+
+    def invalidate_blocked_state(self):
+        """Mark the blocked-waypoint state as changed (pod picked up or dropped)."""
+        self._blocked_state = None
+
+    def intern_item(self, item_name: str) -> int:
+        """Get the integer id of an item name, assigning a new id if unseen."""
+        item_id = self.item_vocab.get(item_name)
+        if item_id is None:
+            item_id = len(self.item_names)
+            self.item_vocab[item_name] = item_id
+            self.item_names.append(item_name)
+        return item_id
 
     def find_pod_with_items(self, items: List[str]) -> Optional[Pod]:
-        """Find a pod containing at least one of the requested items."""
-        for pod in self.pods:
-            if not pod.in_use:
-                for item in items:
-                    if item in pod.items:
-                        return pod
-        return None
+        """Find a pod containing at least one of the requested items.
+
+        Looks up candidates through the item_to_pods index instead of scanning
+        every pod. Of all available pods stocking a requested item, the one
+        with the lowest id wins, as in a scan over self.pods (the index is in
+        stocking order, which changes as items are removed and re-added).
+        """
+        best = None
+        for item in items:
+            item_id = self.item_vocab.get(item)
+            if item_id is None:
+                continue
+            for pod in self.item_to_pods.get(item_id, ()):
+                if not pod.in_use and (best is None or pod.id < best.id):
+                    best = pod
+        return best
 
     def complete_order(self, bot: Bot):
         """Mark an order as completed."""
@@ -214,6 +409,12 @@ class Instance:
             self.stats['orders_completed'] += 1
             self.stats['items_picked'] += len(order['items'])
 
+    def close(self):
+        """Release resources held by the instance (the path-search threads)."""
+        if self.path_pool is not None:
+            self.path_pool.shutdown()
+            self.path_pool = None
+
     def reset_statistics(self):
         """Reset all statistics."""
         self.stats = {
@@ -0,0 +1,51 @@
+"""
+Motion Kernel - Array-based Bot Movement
+
+Advances all bots along their current path segment in one compiled loop over
+the per-bot arrays kept on Instance (see Bot). Used by Instance._advance_bots
+when Numba is installed; without it the NumPy version there is used instead.
+"""
+
+import math
+
+from .astar_numba import njit
+from .bot import IDLE, MOVING
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def advance_bots(state, x, y, target_x, target_y, speed, busy_time, idle_time, distance,
+                 bot_pod, pod_x, pod_y, delta_time, arrivals):
+    """Move every moving bot towards its target by one time step.
+
+    Carried pods (bot_pod >= 0) follow their bots. Moving bots already within
+    0.1 of their target are not moved; their ids are written to arrivals so
+    the caller can handle them per bot. Returns (distance moved in total,
+    number of arrivals).
+    """
+    total = 0.0
+    n_arrivals = 0
+    for i in range(state.shape[0]):
+        if state[i] == IDLE:
+            idle_time[i] += delta_time
+        elif state[i] == MOVING:
+            busy_time[i] += delta_time
+            dx = target_x[i] - x[i]
+            dy = target_y[i] - y[i]
+            distance_sq = dx * dx + dy * dy
+            if distance_sq < 0.01:
+                arrivals[n_arrivals] = i
+                n_arrivals += 1
+                continue
+
+            dist = math.sqrt(distance_sq)
+            step = min(speed[i] * delta_time, dist)
+            x[i] += (dx / dist) * step
+            y[i] += (dy / dist) * step
+            distance[i] += step
+            total += step
+
+            pod = bot_pod[i]
+            if pod >= 0:
+                pod_x[pod] = x[i]
+                pod_y[pod] = y[i]
+    return total, n_arrivals
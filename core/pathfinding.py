@@ -5,7 +5,13 @@ Implements A* pathfinding for robot navigation.
 """
 
 import heapq
-from typing import List, Optional, TYPE_CHECKING
+import os
+from collections import OrderedDict
+from math import inf
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from .astar_numba import astar, NUMBA_AVAILABLE
 
 if TYPE_CHECKING:
     from .instance import Instance
@@ -13,67 +19,159 @@ if TYPE_CHECKING:
 
 
 class AStar:
-    """A* pathfinding algorithm."""
+    """A* pathfinding algorithm with an LRU cache of computed paths."""
 
-    def __init__(self, instance: 'Instance'):
+    def __init__(self, instance: 'Instance', cache_size: int = 4096):
         """Initialize pathfinder."""
         self.instance = instance
+        self.cache_size = cache_size
+
+        # {(start_id, goal_id, blocked_state): path}, least recently used first
+        self._cache: OrderedDict = OrderedDict()
+
+        # Python-list copies of the instance's CSR graph and coordinate arrays
+        # (built on first use)
+        self._adjacency: Optional[tuple] = None
 
     def find_path(self, start: 'Waypoint', goal: 'Waypoint') -> List['Waypoint']:
-        """Find shortest path from start to goal using A*."""
+        """Find shortest path from start to goal, reusing cached results.
+
+        Cached paths are only reused while the set of pod-blocked waypoints
+        is unchanged, so results are identical to a fresh search.
+        """
+        key = (start.id, goal.id, self.instance.get_blocked_state())
+        path = self._cache.get(key)
+        if path is None:
+            path = self.search(start, goal)
+            self._cache[key] = path
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return list(path)
+
+    def find_paths(self, requests: Sequence[Tuple['Waypoint', 'Waypoint']]) -> List[List['Waypoint']]:
+        """Find paths for several (start, goal) pairs at once.
+
+        Cache lookups and updates happen on the calling thread; cache misses
+        are searched on the instance's path_pool when the compiled kernel is
+        available (it releases the GIL), and serially otherwise. The pool is
+        created on first use.
+        """
+        blocked_state = self.instance.get_blocked_state()
+        results: List[Optional[List['Waypoint']]] = [None] * len(requests)
+        misses = []
+        for i, (start, goal) in enumerate(requests):
+            key = (start.id, goal.id, blocked_state)
+            path = self._cache.get(key)
+            if path is None:
+                misses.append((i, key))
+            else:
+                self._cache.move_to_end(key)
+                results[i] = list(path)
+
+        if not misses:
+            return results
+
+        pairs = [requests[i] for i, _ in misses]
+        if NUMBA_AVAILABLE and len(misses) > 1:
+            if self.instance.path_pool is None:
+                self.instance.path_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+            paths = list(self.instance.path_pool.map(lambda pair: self.search(*pair), pairs))
+        else:
+            paths = [self.search(start, goal) for start, goal in pairs]
+
+        for (i, key), path in zip(misses, paths):
+            self._cache[key] = path
+            results[i] = list(path)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return results
+
+    def clear_cache(self):
+        """Drop all cached paths and graph copies (call when the layout changes)."""
+        self._cache.clear()
+        self._adjacency = None
+
+    def search(self, start: 'Waypoint', goal: 'Waypoint') -> List['Waypoint']:
+        """Find shortest path from start to goal using A*.
+
+        Runs the compiled array kernel when Numba is available, otherwise
+        falls back to the pure Python implementation.
+        """
+        instance = self.instance
+        if not NUMBA_AVAILABLE or instance.nbr_offsets is None:
+            return self.search_python(start, goal)
+
+        ids = astar(start.id, goal.id, instance.nbr_offsets, instance.nbr_idx, instance.nbr_cost,
+                    instance.blocked, instance.waypoint_x, instance.waypoint_y)
+        waypoints = instance.waypoints
+        return [waypoints[i] for i in ids.tolist()]
+
+    def search_python(self, start: 'Waypoint', goal: 'Waypoint') -> List['Waypoint']:
+        """Find shortest path from start to goal using A* over the CSR graph in Python."""
         if start == goal:
             return [start]
 
-        # Priority queue: (f_score, waypoint)
-        open_set = [(0, start)]
+        instance = self.instance
+        if instance.nbr_offsets is None:
+            return []  # No graph built yet (see Instance.build_graph_arrays)
+
+        waypoints = instance.waypoints
+        if self._adjacency is None:
+            self._adjacency = (instance.nbr_offsets.tolist(), instance.nbr_idx.tolist(),
+                               instance.waypoint_x.tolist(), instance.waypoint_y.tolist())
+        nbr_offsets, nbr_idx, xs, ys = self._adjacency
+        blocked = instance.blocked
+        start_id = start.id
+        goal_id = goal.id
+
+        # Priority queue: (f_score, waypoint_id). Stale duplicates are skipped
+        # on pop via the closed set instead of being searched for on push.
+        open_set = [(0, start_id)]
+        closed = set()
         came_from = {}
 
-        # g_score: cost from start to waypoint
-        g_score = {wp: float('inf') for wp in self.instance.waypoints}
-        g_score[start] = 0
+        # g_score: cost from start to waypoint (missing entries are infinite)
+        g_score = {start_id: 0}
 
-        # f_score: estimated total cost from start to goal through waypoint
-        f_score = {wp: float('inf') for wp in self.instance.waypoints}
-        f_score[start] = self.heuristic(start, goal)
+        # Specialized for the layout built by Instance.generate_layout: edges
+        # only join axis-aligned neighbors at unit spacing, so every edge costs
+        # 1 and the heuristic is integer Manhattan distance to the goal.
+        goal_x, goal_y = goal.x, goal.y
 
         while open_set:
             _, current = heapq.heappop(open_set)
 
-            if current == goal:
-                return self.reconstruct_path(came_from, current)
+            if current in closed:
+                continue
+            closed.add(current)
 
-            for neighbor in current.paths:
-                # Check if neighbor is accessible (not blocked)
-                if self.is_blocked(neighbor, goal):
-                    continue
+            if current == goal_id:
+                return [waypoints[i] for i in self.reconstruct_path(came_from, current)]
 
-                tentative_g_score = g_score[current] + current.get_distance(neighbor)
+            tentative_g_score = g_score[current] + 1
 
-                if tentative_g_score < g_score[neighbor]:
-                    came_from[neighbor] = current
-                    g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = tentative_g_score + self.heuristic(neighbor, goal)
+            for k in range(nbr_offsets[current], nbr_offsets[current + 1]):
+                neighbor_id = nbr_idx[k]
+                if neighbor_id in closed:
+                    continue
 
-                    # Add to open set if not already there
-                    if not any(neighbor == wp for _, wp in open_set):
-                        heapq.heappush(open_set, (f_score[neighbor], neighbor))
+                # Check if neighbor is accessible (no stored pod, unless it's the goal)
+                if blocked[neighbor_id] and neighbor_id != goal_id:
+                    continue
+
+                if tentative_g_score < g_score.get(neighbor_id, inf):
+                    came_from[neighbor_id] = current
+                    g_score[neighbor_id] = tentative_g_score
+                    f_score = tentative_g_score + abs(xs[neighbor_id] - goal_x) + abs(ys[neighbor_id] - goal_y)
+                    heapq.heappush(open_set, (f_score, neighbor_id))
 
         # No path found
         return []
 
-    def heuristic(self, wp1: 'Waypoint', wp2: 'Waypoint') -> float:
-        """Manhattan distance heuristic."""
-        return abs(wp1.x - wp2.x) + abs(wp1.y - wp2.y)
-
-    def is_blocked(self, waypoint: 'Waypoint', goal: 'Waypoint') -> bool:
-        """Check if waypoint is blocked (has pod, unless it's the goal)."""
-        if waypoint == goal:
-            return False
-        # Waypoint is blocked if it has a pod that's not being carried
-        return waypoint.pod is not None and not waypoint.pod.in_use
-
-    def reconstruct_path(self, came_from: dict, current: 'Waypoint') -> List['Waypoint']:
-        """Reconstruct path from came_from map."""
+    def reconstruct_path(self, came_from: dict, current):
+        """Reconstruct path from came_from map (waypoints or waypoint ids)."""
         path = [current]
         while current in came_from:
             current = came_from[current]
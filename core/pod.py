@@ -6,14 +6,42 @@ Represents a storage pod that can hold items.
 
 from typing import Dict, Optional, TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from .instance import Instance
     from .waypoint import Waypoint
     from .bot import Bot
 
 
+class _PodArrayField:
+    """Attribute stored in one of the instance's per-pod arrays (indexed by pod id)."""
+
+    def __init__(self, array_name: str):
+        self.array_name = array_name
+
+    def __get__(self, pod: 'Pod', owner=None):
+        if pod is None:
+            return self
+        return getattr(pod.instance, self.array_name)[pod.id]
+
+    def __set__(self, pod: 'Pod', value):
+        getattr(pod.instance, self.array_name)[pod.id] = value
+
+
 class Pod:
-    """Storage pod containing items."""
+    """Storage pod containing items.
+
+    Position and in-use flag live in NumPy arrays on the instance so that
+    carried pods can follow their bots (and be drawn) in vectorized steps.
+    """
+
+    __slots__ = ('id', 'capacity', 'instance', 'waypoint', 'bot',
+                 'counts', 'capacity_used', 'items_handled', 'bundles_handled')
+
+    x = _PodArrayField('pod_x')
+    y = _PodArrayField('pod_y')
+    in_use = _PodArrayField('pod_in_use')
 
     def __init__(self, pod_id: int, capacity: float, instance: 'Instance'):
         """Initialize a pod."""
@@ -30,21 +58,31 @@ class Pod:
         self.in_use = False
         self.bot: Optional['Bot'] = None
 
-        # Contents (simplified - just item names and counts)
-        self.items: Dict[str, int] = {}
+        # Contents (simplified - item counts indexed by Instance.item_vocab id)
+        self.counts = np.zeros(len(instance.item_names), dtype=np.int32)
         self.capacity_used = 0.0
 
         # Statistics
         self.items_handled = 0
         self.bundles_handled = 0
 
+    @property
+    def items(self) -> Dict[str, int]:
+        """Get the stored items as {item_name: count}."""
+        names = self.instance.item_names
+        return {names[i]: int(self.counts[i]) for i in np.flatnonzero(self.counts).tolist()}
+
     def add_item(self, item_name: str, weight: float = 1.0, count: int = 1):
         """Add an item to the pod."""
         if self.capacity_used + weight * count <= self.capacity:
-            if item_name in self.items:
-                self.items[item_name] += count
-            else:
-                self.items[item_name] = count
+            item_id = self.instance.intern_item(item_name)
+            if item_id >= len(self.counts):
+                grown = np.zeros(max(item_id + 1, 2 * len(self.counts)), dtype=np.int32)
+                grown[:len(self.counts)] = self.counts
+                self.counts = grown
+            if self.counts[item_id] == 0:
+                self.instance.item_to_pods[item_id][self] = None
+            self.counts[item_id] += count
             self.capacity_used += weight * count
             self.bundles_handled += 1
             return True
@@ -52,10 +90,11 @@ class Pod:
 
     def remove_item(self, item_name: str, weight: float = 1.0, count: int = 1):
         """Remove an item from the pod."""
-        if item_name in self.items and self.items[item_name] >= count:
-            self.items[item_name] -= count
-            if self.items[item_name] <= 0:
-                del self.items[item_name]
+        item_id = self.instance.item_vocab.get(item_name, -1)
+        if 0 <= item_id < len(self.counts) and self.counts[item_id] >= count:
+            self.counts[item_id] -= count
+            if self.counts[item_id] <= 0:
+                self.instance.item_to_pods[item_id].pop(self, None)
             self.capacity_used -= weight * count
             self.items_handled += count
             return True
@@ -63,7 +102,8 @@ class Pod:
 
     def contains(self, item_name: str) -> bool:
         """Check if pod contains an item."""
-        return item_name in self.items and self.items[item_name] > 0
+        item_id = self.instance.item_vocab.get(item_name, -1)
+        return 0 <= item_id < len(self.counts) and self.counts[item_id] > 0
 
     def get_capacity_utilization(self) -> float:
         """Get capacity utilization as a percentage."""
@@ -15,20 +15,31 @@ class SimulationExecutor:
     """Executes simulation instances."""
 
     @staticmethod
-    def execute(instance: 'Instance'):
-        """Execute a simulation instance (headless mode)."""
-        warmup_time = instance.config['simulation'].get('warmup_time', 10)
-        duration = instance.config['simulation'].get('duration', 300)
-        time_step = instance.config['simulation'].get('time_step', 0.1)
+    def execute(instance: 'Instance', real_time: bool = False):
+        """Execute a simulation instance (headless mode).
+
+        By default the simulation runs as fast as possible. With real_time,
+        each step is paced so simulated time advances with wall-clock time.
+        """
+        sim_cfg = instance.config.simulation
+        warmup_time = sim_cfg.warmup_time
+        duration = sim_cfg.duration
+        time_step = sim_cfg.time_step
 
         print(f"\n>>> Warming up ({warmup_time}s)...")
         instance.running = True
         start_time = time.time()
 
+        # Wall-clock pacing for real-time mode
+        pace_start = time.monotonic()
+        steps = 0
+
         # Warmup phase
         while instance.current_time < warmup_time:
             instance.update(time_step)
-            time.sleep(0.01)  # Prevent busy waiting
+            steps += 1
+            if real_time:
+                time.sleep(max(0.0, pace_start + steps * time_step - time.monotonic()))
 
         print(">>> Warmup complete!")
         print(f">>> Running simulation ({duration}s)...\n")
@@ -36,15 +47,20 @@ class SimulationExecutor:
         # Reset statistics after warmup
         instance.reset_statistics()
         sim_start_time = instance.current_time
+        last_printed = int(instance.current_time) // 60
 
         # Main simulation loop
         try:
             while instance.current_time - sim_start_time < duration:
                 instance.update(time_step)
-                time.sleep(0.01)  # Prevent busy waiting
+                steps += 1
+                if real_time:
+                    time.sleep(max(0.0, pace_start + steps * time_step - time.monotonic()))
 
                 # Print progress every 60 seconds
-                if int(instance.current_time) % 60 == 0 and instance.current_time > 0:
+                minute = int(instance.current_time) // 60
+                if minute != last_printed:
+                    last_printed = minute
                     elapsed = instance.current_time - sim_start_time
                     print(f"Progress: {elapsed:.0f}s / {duration}s - Orders: {instance.stats['orders_completed']}")
 
@@ -53,6 +69,7 @@ class SimulationExecutor:
 
         instance.running = False
         instance.stats['end_time'] = time.time()
+        instance.close()
 
         # Print final statistics
         instance.print_statistics()
\ No newline at end of file
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class InputStation:
     """Input station where items enter the warehouse."""
 
+    __slots__ = ('id', 'waypoint', 'instance', 'bundles_stored', 'items_stored')
+
     def __init__(self, station_id: int, waypoint: 'Waypoint', instance: 'Instance'):
         """Initialize an input station."""
         self.id = station_id
@@ -31,6 +33,8 @@ class InputStation:
 class OutputStation:
     """Output station where orders are fulfilled."""
 
+    __slots__ = ('id', 'waypoint', 'instance', 'orders_completed', 'items_picked')
+
     def __init__(self, station_id: int, waypoint: 'Waypoint', instance: 'Instance'):
         """Initialize an output station."""
         self.id = station_id
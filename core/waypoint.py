@@ -5,7 +5,6 @@ Represents a waypoint in the warehouse navigation graph.
 """
 
 from typing import List, Optional, TYPE_CHECKING
-import math
 
 if TYPE_CHECKING:
     from .instance import Instance
@@ -16,6 +15,9 @@ if TYPE_CHECKING:
 class Waypoint:
     """Waypoint in the warehouse navigation graph."""
 
+    __slots__ = ('id', 'x', 'y', 'instance', 'paths', 'path_distances', 'pod',
+                 'input_station', 'output_station', 'pod_storage_location', 'is_queue')
+
     def __init__(self, waypoint_id: int, x: float, y: float, instance: 'Instance'):
         """Initialize a waypoint."""
         self.id = waypoint_id
@@ -36,22 +38,25 @@ class Waypoint:
         self.pod_storage_location = False
         self.is_queue = False
 
-        # Bot tracking
-        self.bots_approaching = set()
-        self.bots_leaving = set()
+    def connect(self, other: 'Waypoint'):
+        """Add paths in both directions between this waypoint and another.
 
-    def add_path(self, other: 'Waypoint'):
-        """Add a directed path to another waypoint."""
-        if other not in self.paths:
-            self.paths.append(other)
-            distance = self.get_distance(other)
-            self.path_distances[other] = distance
+        Each pair must be connected only once (Instance.generate_layout emits
+        every grid edge once).
+        """
+        distance = self.get_distance(other)
+        self.paths.append(other)
+        self.path_distances[other] = distance
+        other.paths.append(self)
+        other.path_distances[self] = distance
 
     def get_distance(self, other: 'Waypoint') -> float:
-        """Calculate Euclidean distance to another waypoint."""
-        dx = self.x - other.x
-        dy = self.y - other.y
-        return math.sqrt(dx * dx + dy * dy)
+        """Calculate Manhattan distance to another waypoint.
+
+        The layout only connects axis-aligned neighbors, so this equals the
+        travel distance along the grid and matches the A* heuristic.
+        """
+        return abs(self.x - other.x) + abs(self.y - other.y)
 
     def is_accessible(self, other: 'Waypoint') -> bool:
         """Check if another waypoint is directly accessible."""
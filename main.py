@@ -9,56 +9,56 @@ Based on: merschformann/RAWSim-O (C# .NET)
 """
 
 import argparse
+import dataclasses
 import json
 import sys
 from pathlib import Path
 
+try:
+    import msgspec  # Optional: faster JSON parsing
+except ImportError:
+    msgspec = None
+
+from core.config import WarehouseConfig
 from core.instance import Instance
 from core.simulator import SimulationExecutor
-from visualization.renderer_2d import Renderer2D
-from visualization.renderer_3d import Renderer3D
 
 
-def load_config(config_path: str) -> dict:
+def load_config(config_path: str) -> WarehouseConfig:
     """Load configuration from JSON file."""
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        with open(config_path, 'rb') as f:
+            data = parse_json(f.read())
     except FileNotFoundError:
         print(f"Warning: Config file '{config_path}' not found. Using defaults.")
         return get_default_config()
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         print(f"Error parsing config file: {e}")
         sys.exit(1)
 
+    try:
+        return WarehouseConfig.from_dict(data)
+    except TypeError as e:
+        print(f"Error in config file: {e}")
+        sys.exit(1)
+
+
+def parse_json(raw: bytes) -> dict:
+    """Parse a JSON document, with msgspec when it is installed.
+
+    Raises ValueError if the document is not valid JSON.
+    """
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(raw)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    return json.loads(raw)
+
 
-def get_default_config() -> dict:
+def get_default_config() -> WarehouseConfig:
     """Return default configuration."""
-    return {
-        "warehouse": {
-            "width": 30,
-            "height": 20,
-            "pod_storage_rows": 5
-        },
-        "robots": {
-            "count": 8,
-            "speed": 2.0,
-            "capacity": 1
-        },
-        "pods": {
-            "count": 40,
-            "capacity": 100.0
-        },
-        "stations": {
-            "input_count": 2,
-            "output_count": 2
-        },
-        "simulation": {
-            "duration": 300,
-            "warmup_time": 10,
-            "time_step": 0.1
-        }
-    }
+    return WarehouseConfig()
 
 
 def print_banner():
@@ -115,18 +115,19 @@ def main():
 
     # Override duration if specified
     if args.duration:
-        config['simulation']['duration'] = args.duration
+        config = dataclasses.replace(
+            config, simulation=dataclasses.replace(config.simulation, duration=args.duration))
 
     # Create simulation instance
     print("\nInitializing simulation instance...")
     instance = Instance(config)
     instance.generate_layout()
 
-    print(f"\nWarehouse Layout: {config['warehouse']['width']}x{config['warehouse']['height']} grid")
-    print(f"Robots: {config['robots']['count']}")
-    print(f"Pods: {config['pods']['count']}")
-    print(f"Input Stations: {config['stations']['input_count']}")
-    print(f"Output Stations: {config['stations']['output_count']}")
+    print(f"\nWarehouse Layout: {config.warehouse.width}x{config.warehouse.height} grid")
+    print(f"Robots: {config.robots.count}")
+    print(f"Pods: {config.pods.count}")
+    print(f"Input Stations: {config.stations.input_count}")
+    print(f"Output Stations: {config.stations.output_count}")
 
     # Run simulation
     if args.no_gui:
@@ -143,11 +144,13 @@ def main():
             print("  +/- - Speed up/slow down")
             print("  S - Show/hide statistics")
             print("  ESC - Exit\n")
+            from visualization.renderer_2d import Renderer2D
             renderer = Renderer2D(instance)
             renderer.run()
 
         if args.mode == '3d':
             print("\nStarting 3D visualization...")
+            from visualization.renderer_3d import Renderer3D
             renderer = Renderer3D(instance)
             renderer.run()
 
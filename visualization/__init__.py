@@ -2,9 +2,29 @@
 RAWSim-O MVP Visualization Module
 
 Visualization components for 2D and 3D rendering.
+
+Renderers are imported on first access, so using one does not pay for the
+other's backend (pygame or matplotlib).
 """
 
-from .renderer_2d import Renderer2D
-from .renderer_3d import Renderer3D
+import importlib
+
+_RENDERER_MODULES = {
+    'Renderer2D': '.renderer_2d',
+    'Renderer3D': '.renderer_3d',
+}
+
+__all__ = ['Renderer2D', 'Renderer3D']
+
+
+def __getattr__(name):
+    module_name = _RENDERER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    renderer = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = renderer  # Later lookups skip this hook
+    return renderer
+
 
-__all__ = ['Renderer2D', 'Renderer3D']
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,7 +6,11 @@ Real-time interactive 2D visualization using Pygame.
 
 import pygame
 import sys
-from typing import TYPE_CHECKING
+import threading
+import time
+from typing import Dict, Tuple, TYPE_CHECKING
+
+import numpy as np
 
 if TYPE_CHECKING:
     from core.instance import Instance
@@ -21,15 +25,26 @@ class Renderer2D:
         self.cell_size = cell_size
 
         # Calculate window size
-        width = instance.config['warehouse']['width']
-        height = instance.config['warehouse']['height']
+        width = instance.config.warehouse.width
+        height = instance.config.warehouse.height
         self.window_width = width * cell_size + 300  # Extra space for UI
         self.window_height = height * cell_size + 100
 
         # Initialize Pygame
         pygame.init()
-        self.screen = pygame.display.set_mode((self.window_width, self.window_height))
+        # SCALED draws through an SDL renderer, so flip() is a texture upload
+        # and page flip; vsync is best effort and skipped where unsupported
+        flags = pygame.DOUBLEBUF | pygame.SCALED
+        try:
+            self.screen = pygame.display.set_mode((self.window_width, self.window_height), flags, vsync=1)
+        except pygame.error:
+            self.screen = pygame.display.set_mode((self.window_width, self.window_height), flags)
         pygame.display.set_caption("RAWSim-O MVP - 2D View")
+
+        # Only queue the events the main loop handles; everything else is
+        # dropped by SDL instead of piling up in the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 24)
         self.small_font = pygame.font.Font(None, 18)
@@ -54,34 +69,187 @@ class Renderer2D:
         self.speed_multiplier = 1.0
         self.offset_x = 50
         self.offset_y = 50
+        self._build_transforms()
+
+        # Sprites and fixed UI labels are rendered once and blitted each frame
+        self._build_sprites()
+        self._build_text()
+
+        # Waypoints and stations never move: draw them once into the background
+        self._background: pygame.Surface = None
+        self._build_background()
+
+        # Simulation runs on a worker thread in fixed steps (see _sim_loop)
+        self.fixed_dt = 1.0 / 60.0
+        self._dt_debt = 0.0  # simulation time owed, in units of fixed_dt
+        self._sim_thread: threading.Thread = None
+        self._reset_requested = False
+
+        # Set when a new frame is committed or a key changes the view; cleared by render()
+        self._dirty = True
+
+        # Double-buffered bot/pod positions: the simulation thread fills the
+        # back buffer and swaps it in under the lock; drawing reads the front
+        self._state_lock = threading.Lock()
+        self._buffers = [self._new_frame_buffer(), self._new_frame_buffer()]
+        self._front = 0
+        self._commit_frame()
+
+    def _build_transforms(self):
+        """Specialize the world-to-screen transforms for this window.
+
+        Cell size, offsets and the warehouse width are fixed once the window
+        is open, so they are bound as default arguments (fast local loads)
+        rather than read from attributes on every call.
+        """
+        def to_screen(xs: np.ndarray, ys: np.ndarray, half_size: int,
+                      cs=self.cell_size, ox=self.offset_x, oy=self.offset_y, int32=np.int32):
+            """Transform world coordinates to top-left screen positions of a sprite."""
+            sx = (xs * cs + ox).astype(int32) - half_size
+            sy = (ys * cs + oy).astype(int32) - half_size
+            return zip(sx.tolist(), sy.tolist())
+
+        def cell_to_screen(x, y, cs=self.cell_size, ox=self.offset_x, oy=self.offset_y):
+            """Transform one world position to screen coordinates."""
+            return ox + x * cs, oy + y * cs
+
+        self._to_screen = to_screen
+        self._cell_to_screen = cell_to_screen
+        self._ui_x = self.offset_x + self.instance.config.warehouse.width * self.cell_size + 20
+
+    def _build_sprites(self):
+        """Pre-render one Surface per kind of drawn entity."""
+        def sprite(size):
+            return pygame.Surface((size, size), pygame.SRCALPHA)
+
+        self._pod_surf = sprite(12)
+        pygame.draw.circle(self._pod_surf, self.colors['pod'], (6, 6), 6)
+
+        self._bot_idle_surf = sprite(12)
+        self._bot_idle_surf.fill(self.colors['bot_idle'])
+        self._bot_busy_surf = sprite(12)
+        self._bot_busy_surf.fill(self.colors['bot_busy'])
+        pygame.draw.circle(self._bot_busy_surf, self.colors['pod'], (6, 6), 4)
+
+        self._storage_surf = sprite(6)
+        self._storage_surf.fill(self.colors['storage'])
+        self._waypoint_surf = sprite(6)
+        pygame.draw.circle(self._waypoint_surf, self.colors['waypoint'], (3, 3), 2)
+
+        self._input_station_surf = sprite(16)
+        self._input_station_surf.fill(self.colors['input_station'])
+        self._output_station_surf = sprite(16)
+        self._output_station_surf.fill(self.colors['output_station'])
+
+        # Station labels never change, so render them once as well
+        self._station_labels = [
+            (self.small_font.render(f"I{station.id}", True, self.colors['text']), station, -20)
+            for station in self.instance.input_stations
+        ] + [
+            (self.small_font.render(f"O{station.id}", True, self.colors['text']), station, 10)
+            for station in self.instance.output_stations
+        ]
+
+    def _build_background(self):
+        """Render the background, waypoint grid and stations into a cached Surface.
+
+        Call again if the layout is regenerated.
+        """
+        self._background = pygame.Surface((self.window_width, self.window_height)).convert()
+        self._background.fill(self.colors['background'])
+        self.draw_waypoints(self._background)
+        self.draw_stations(self._background)
 
     def run(self):
         """Main rendering loop."""
         self.instance.running = True
+        self._sim_thread = threading.Thread(target=self._sim_loop, daemon=True)
+        self._sim_thread.start()
         running = True
+        last_render = 0.0
 
         while running:
-            dt = self.clock.tick(60) / 1000.0  # 60 FPS, delta time in seconds
+            self.clock.tick(60)  # 60 FPS
 
-            # Handle events
-            for event in pygame.event.get():
+            # Handle events (pumped once per frame, drained in one batch)
+            pygame.event.pump()
+            for event in pygame.event.get(eventtype=(pygame.QUIT, pygame.KEYDOWN), pump=False):
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
                     running = self.handle_keypress(event.key)
 
-            # Update simulation
-            if not self.instance.paused:
-                self.instance.update(dt * self.speed_multiplier)
-
-            # Render
-            self.render()
-
-            pygame.display.flip()
+            # Render only when something changed (at least once a second)
+            now = time.perf_counter()
+            if self._dirty or now - last_render >= 1.0:
+                self.render()
+                pygame.display.flip()
+                last_render = now
 
         self.instance.running = False
+        self._sim_thread.join()
+        self.instance.close()
         pygame.quit()
 
+    def _sim_loop(self):
+        """Advance the simulation in fixed time steps (runs on the worker thread)."""
+        next_tick = time.perf_counter()
+        while self.instance.running:
+            if self._reset_requested:
+                self._reset_requested = False
+                self.instance.current_time = 0
+                self.instance.reset_statistics()
+                self._dirty = True
+
+            if not self.instance.paused:
+                # Speed up by taking more fixed steps per tick, not longer ones;
+                # multipliers below 1 take one step every few ticks
+                self._dt_debt += self.speed_multiplier
+                steps = int(self._dt_debt)
+                self._dt_debt -= steps
+                for _ in range(steps):
+                    self.instance.update(self.fixed_dt)
+                if steps:
+                    self._commit_frame()
+
+            # Pace to wall-clock time; resynchronize if we fell behind
+            next_tick += self.fixed_dt
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.perf_counter()
+
+    def _new_frame_buffer(self) -> dict:
+        """Allocate one buffer of bot/pod draw state."""
+        bot_count = len(self.instance.bots)
+        pod_count = len(self.instance.pods)
+        return {
+            'bot_x': np.zeros(bot_count),
+            'bot_y': np.zeros(bot_count),
+            'bot_carrying': np.zeros(bot_count, dtype=np.bool_),
+            'pod_x': np.zeros(pod_count),
+            'pod_y': np.zeros(pod_count),
+            'pod_stored': np.zeros(pod_count, dtype=np.bool_),
+        }
+
+    def _commit_frame(self):
+        """Copy current bot/pod positions into the back buffer and swap it in."""
+        instance = self.instance
+        back = self._buffers[1 - self._front]
+        bot_count = len(instance.bots)
+        back['bot_x'][:] = instance.bot_x[:bot_count]
+        back['bot_y'][:] = instance.bot_y[:bot_count]
+        np.greater_equal(instance.bot_pod[:bot_count], 0, out=back['bot_carrying'])
+        pod_count = len(instance.pods)
+        back['pod_x'][:] = instance.pod_x[:pod_count]
+        back['pod_y'][:] = instance.pod_y[:pod_count]
+        np.logical_not(instance.pod_in_use[:pod_count], out=back['pod_stored'])
+
+        with self._state_lock:
+            self._front = 1 - self._front
+        self._dirty = True
+
     def handle_keypress(self, key) -> bool:
         """Handle keyboard input."""
         if key == pygame.K_ESCAPE:
@@ -89,26 +257,23 @@ class Renderer2D:
         elif key == pygame.K_SPACE:
             self.instance.paused = not self.instance.paused
         elif key == pygame.K_r:
-            # Reset simulation
-            self.instance.current_time = 0
-            self.instance.reset_statistics()
+            # Reset simulation (applied by the simulation thread)
+            self._reset_requested = True
         elif key == pygame.K_PLUS or key == pygame.K_EQUALS:
             self.speed_multiplier = min(self.speed_multiplier * 2, 16)
         elif key == pygame.K_MINUS:
             self.speed_multiplier = max(self.speed_multiplier / 2, 0.25)
         elif key == pygame.K_s:
             self.show_stats = not self.show_stats
+        self._dirty = True
         return True
 
     def render(self):
         """Render the warehouse."""
-        self.screen.fill(self.colors['background'])
-
-        # Draw grid and waypoints
-        self.draw_waypoints()
+        self._dirty = False
 
-        # Draw stations
-        self.draw_stations()
+        # Background, grid, waypoints and stations (pre-rendered)
+        self.screen.blit(self._background, (0, 0))
 
         # Draw pods
         self.draw_pods()
@@ -119,122 +284,126 @@ class Renderer2D:
         # Draw UI
         self.draw_ui()
 
-    def draw_waypoints(self):
+    def draw_waypoints(self, surface: pygame.Surface):
         """Draw waypoint grid."""
-        for wp in self.instance.waypoints:
-            x = self.offset_x + wp.x * self.cell_size
-            y = self.offset_y + wp.y * self.cell_size
-
-            # Draw storage locations differently
-            if wp.pod_storage_location:
-                color = self.colors['storage']
-                pygame.draw.rect(self.screen, color, (x - 3, y - 3, 6, 6))
-            else:
-                color = self.colors['waypoint']
-                pygame.draw.circle(self.screen, color, (x, y), 2)
+        # Integer screen positions for all waypoints in one NumPy pass
+        positions = self._to_screen(self.instance.waypoint_x, self.instance.waypoint_y, 3)
+
+        # Draw storage locations differently
+        sprites = (self._waypoint_surf, self._storage_surf)
+        surface.blits([(sprites[wp.pod_storage_location], pos)
+                       for wp, pos in zip(self.instance.waypoints, positions)], doreturn=False)
 
-    def draw_stations(self):
+    def draw_stations(self, surface: pygame.Surface):
         """Draw input and output stations."""
-        # Input stations
+        blit_list = []
         for station in self.instance.input_stations:
-            wp = station.waypoint
-            x = self.offset_x + wp.x * self.cell_size
-            y = self.offset_y + wp.y * self.cell_size
-            pygame.draw.rect(self.screen, self.colors['input_station'], (x - 8, y - 8, 16, 16))
-            text = self.small_font.render(f"I{station.id}", True, self.colors['text'])
-            self.screen.blit(text, (x - 8, y - 20))
-
-        # Output stations
+            blit_list.append((self._input_station_surf, self._station_pos(station, -8)))
         for station in self.instance.output_stations:
-            wp = station.waypoint
-            x = self.offset_x + wp.x * self.cell_size
-            y = self.offset_y + wp.y * self.cell_size
-            pygame.draw.rect(self.screen, self.colors['output_station'], (x - 8, y - 8, 16, 16))
-            text = self.small_font.render(f"O{station.id}", True, self.colors['text'])
-            self.screen.blit(text, (x - 8, y + 10))
+            blit_list.append((self._output_station_surf, self._station_pos(station, -8)))
+        for text, station, dy in self._station_labels:
+            blit_list.append((text, self._station_pos(station, dy)))
+        surface.blits(blit_list, doreturn=False)
+
+    def _station_pos(self, station, dy: int):
+        """Top-left corner for a sprite drawn dy pixels below the station center."""
+        x, y = self._cell_to_screen(station.waypoint.x, station.waypoint.y)
+        return (x - 8, y + dy)
 
     def draw_pods(self):
         """Draw pods."""
-        for pod in self.instance.pods:
-            if not pod.in_use:  # Don't draw pods being carried
-                x = self.offset_x + pod.x * self.cell_size
-                y = self.offset_y + pod.y * self.cell_size
-                pygame.draw.circle(self.screen, self.colors['pod'], (int(x), int(y)), 6)
+        with self._state_lock:
+            frame = self._buffers[self._front]
+            stored = frame['pod_stored']  # Don't draw pods being carried
+            positions = self._to_screen(frame['pod_x'][stored], frame['pod_y'][stored], 6)
+
+        pod_surf = self._pod_surf
+        self.screen.blits([(pod_surf, pos) for pos in positions], doreturn=False)
 
     def draw_bots(self):
         """Draw robots."""
-        for bot in self.instance.bots:
-            x = self.offset_x + bot.x * self.cell_size
-            y = self.offset_y + bot.y * self.cell_size
+        with self._state_lock:
+            frame = self._buffers[self._front]
+            positions = self._to_screen(frame['bot_x'], frame['bot_y'], 6)
+            carrying = frame['bot_carrying'].tolist()
+
+        # Busy sprite is tinted and shows the carried pod
+        sprites = (self._bot_idle_surf, self._bot_busy_surf)
+        self.screen.blits([(sprites[busy], pos) for busy, pos in zip(carrying, positions)],
+                          doreturn=False)
+
+    def _build_text(self):
+        """Pre-render the UI labels that never change."""
+        text_color = self.colors['text']
+        self._title_surf = self.font.render("RAWSim-O MVP", True, text_color)
+        self._stats_title_surf = self.font.render("Statistics", True, text_color)
+        self._status_surfs = {
+            True: self.small_font.render("PAUSED", True, (255, 200, 100)),
+            False: self.small_font.render("RUNNING", True, (100, 255, 100)),
+        }
+        self._controls_title_surf = self.small_font.render("Controls:", True, text_color)
+        self._controls_surfs = [
+            self.small_font.render(control, True, (180, 180, 180))
+            for control in ("SPACE: Pause", "R: Reset", "+/-: Speed", "S: Stats")
+        ]
 
-            # Color based on state
-            color = self.colors['bot_busy'] if bot.carrying_pod else self.colors['bot_idle']
-            pygame.draw.rect(self.screen, color, (x - 6, y - 6, 12, 12))
+        # Dynamic lines: {slot: (text, surface)}, re-rendered only when the text changes
+        self._text_cache: Dict[str, Tuple[str, pygame.Surface]] = {}
 
-            # Draw carried pod
-            if bot.carrying_pod:
-                pygame.draw.circle(self.screen, self.colors['pod'], (int(x), int(y)), 4)
+    def _render_text(self, slot: str, text: str) -> pygame.Surface:
+        """Get the surface for a dynamic UI line, rendering it only if it changed."""
+        cached = self._text_cache.get(slot)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        surf = self.small_font.render(text, True, self.colors['text'])
+        self._text_cache[slot] = (text, surf)
+        return surf
 
     def draw_ui(self):
         """Draw UI overlay."""
-        ui_x = self.offset_x + self.instance.config['warehouse']['width'] * self.cell_size + 20
+        ui_x = self._ui_x
         y = 20
 
         # Title
-        title = self.font.render("RAWSim-O MVP", True, self.colors['text'])
-        self.screen.blit(title, (ui_x, y))
+        self.screen.blit(self._title_surf, (ui_x, y))
         y += 40
 
         # Time
-        time_text = self.small_font.render(f"Time: {self.instance.current_time:.1f}s", True, self.colors['text'])
+        time_text = self._render_text('time', f"Time: {self.instance.current_time:.1f}s")
         self.screen.blit(time_text, (ui_x, y))
         y += 25
 
         # Speed
-        speed_text = self.small_font.render(f"Speed: {self.speed_multiplier}x", True, self.colors['text'])
+        speed_text = self._render_text('speed', f"Speed: {self.speed_multiplier}x")
         self.screen.blit(speed_text, (ui_x, y))
         y += 25
 
         # Status
-        status = "PAUSED" if self.instance.paused else "RUNNING"
-        status_color = (255, 200, 100) if self.instance.paused else (100, 255, 100)
-        status_text = self.small_font.render(status, True, status_color)
-        self.screen.blit(status_text, (ui_x, y))
+        self.screen.blit(self._status_surfs[bool(self.instance.paused)], (ui_x, y))
         y += 40
 
         # Statistics
         if self.show_stats:
-            stats_title = self.font.render("Statistics", True, self.colors['text'])
-            self.screen.blit(stats_title, (ui_x, y))
+            self.screen.blit(self._stats_title_surf, (ui_x, y))
             y += 30
 
             stats = [
-                f"Orders: {self.instance.stats['orders_completed']}",
-                f"Items: {self.instance.stats['items_picked']}",
-                f"Distance: {self.instance.stats['total_distance_traveled']:.1f}",
-                f"Robots: {len(self.instance.bots)}",
-                f"Pods: {len(self.instance.pods)}",
+                ('orders', f"Orders: {self.instance.stats['orders_completed']}"),
+                ('items', f"Items: {self.instance.stats['items_picked']}"),
+                ('distance', f"Distance: {self.instance.stats['total_distance_traveled']:.1f}"),
+                ('robots', f"Robots: {len(self.instance.bots)}"),
+                ('pods', f"Pods: {len(self.instance.pods)}"),
             ]
 
-            for stat in stats:
-                text = self.small_font.render(stat, True, self.colors['text'])
-                self.screen.blit(text, (ui_x, y))
+            for slot, stat in stats:
+                self.screen.blit(self._render_text(slot, stat), (ui_x, y))
                 y += 20
 
         # Controls
         y = self.window_height - 120
-        controls_title = self.small_font.render("Controls:", True, self.colors['text'])
-        self.screen.blit(controls_title, (ui_x, y))
+        self.screen.blit(self._controls_title_surf, (ui_x, y))
         y += 20
 
-        controls = [
-            "SPACE: Pause",
-            "R: Reset",
-            "+/-: Speed",
-            "S: Stats",
-        ]
-
-        for control in controls:
-            text = self.small_font.render(control, True, (180, 180, 180))
+        for text in self._controls_surfs:
             self.screen.blit(text, (ui_x, y))
-            y += 18
\ No newline at end of file
+            y += 18
@@ -5,7 +5,7 @@ Static/animated 3D visualization using Matplotlib.
 """
 
 import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
+from matplotlib.lines import Line2D
 import numpy as np
 from typing import TYPE_CHECKING
 
@@ -22,6 +22,17 @@ class Renderer3D:
         self.fig = plt.figure(figsize=(12, 8))
         self.ax = self.fig.add_subplot(111, projection='3d')
 
+        # Waypoints are static: their coordinates are built once (see _build_waypoint_arrays)
+        self._waypoint_xyz = None
+        self._storage_xyz = None
+
+        self._bot_legend_handles = [
+            Line2D([0], [0], marker='s', color='w', markerfacecolor='red', markersize=10,
+                   label='Bot (carrying)'),
+            Line2D([0], [0], marker='s', color='w', markerfacecolor='green', markersize=10,
+                   label='Bot (idle)'),
+        ]
+
     def run(self, animate: bool = False):
         """Run 3D visualization."""
         if animate:
@@ -31,6 +42,20 @@ class Renderer3D:
         self.render_static()
         plt.show()
 
+    def _build_waypoint_arrays(self):
+        """Build float32 coordinate arrays for all waypoints and storage locations.
+
+        Call again if the layout is regenerated.
+        """
+        waypoints = self.instance.waypoints
+        n = len(waypoints)
+        wx = np.fromiter((wp.x for wp in waypoints), dtype=np.float32, count=n)
+        wy = np.fromiter((wp.y for wp in waypoints), dtype=np.float32, count=n)
+        storage = np.fromiter((wp.pod_storage_location for wp in waypoints), dtype=np.bool_, count=n)
+        z = np.zeros(n, dtype=np.float32)
+        self._waypoint_xyz = (wx, wy, z)
+        self._storage_xyz = (wx[storage], wy[storage], z[storage])
+
     def render_static(self):
         """Render a static 3D view of the warehouse."""
         self.ax.clear()
@@ -41,60 +66,57 @@ class Renderer3D:
         self.ax.set_zlabel('Z')
         self.ax.set_title('RAWSim-O MVP - 3D Warehouse View')
 
+        if self._waypoint_xyz is None:
+            self._build_waypoint_arrays()
+
         # Draw waypoints as a grid at z=0
-        waypoint_x = [wp.x for wp in self.instance.waypoints]
-        waypoint_y = [wp.y for wp in self.instance.waypoints]
-        waypoint_z = [0] * len(self.instance.waypoints)
-        self.ax.scatter(waypoint_x, waypoint_y, waypoint_z, c='gray', marker='.', s=10, alpha=0.3)
+        self.ax.scatter(*self._waypoint_xyz, c='gray', marker='.', s=10, alpha=0.3)
 
         # Draw storage locations
-        storage_wps = [wp for wp in self.instance.waypoints if wp.pod_storage_location]
-        if storage_wps:
-            storage_x = [wp.x for wp in storage_wps]
-            storage_y = [wp.y for wp in storage_wps]
-            storage_z = [0] * len(storage_wps)
-            self.ax.scatter(storage_x, storage_y, storage_z, c='lightblue', marker='s', s=50, alpha=0.5)
+        if len(self._storage_xyz[0]):
+            self.ax.scatter(*self._storage_xyz, c='lightblue', marker='s', s=50, alpha=0.5)
 
         # Draw input stations
-        for station in self.instance.input_stations:
-            wp = station.waypoint
-            self.ax.scatter([wp.x], [wp.y], [0], c='yellow', marker='^', s=200, label=f'Input {station.id}')
+        if self.instance.input_stations:
+            input_x = [station.waypoint.x for station in self.instance.input_stations]
+            input_y = [station.waypoint.y for station in self.instance.input_stations]
+            self.ax.scatter(input_x, input_y, np.zeros(len(input_x)), c='yellow', marker='^', s=200,
+                            label='Input stations')
 
         # Draw output stations
-        for station in self.instance.output_stations:
-            wp = station.waypoint
-            self.ax.scatter([wp.x], [wp.y], [0], c='purple', marker='v', s=200, label=f'Output {station.id}')
+        if self.instance.output_stations:
+            output_x = [station.waypoint.x for station in self.instance.output_stations]
+            output_y = [station.waypoint.y for station in self.instance.output_stations]
+            self.ax.scatter(output_x, output_y, np.zeros(len(output_x)), c='purple', marker='v', s=200,
+                            label='Output stations')
 
         # Draw pods (at height 0.5)
-        pod_x = [pod.x for pod in self.instance.pods if not pod.in_use]
-        pod_y = [pod.y for pod in self.instance.pods if not pod.in_use]
-        pod_z = [0.5] * len([pod for pod in self.instance.pods if not pod.in_use])
-        if pod_x:
-            self.ax.scatter(pod_x, pod_y, pod_z, c='blue', marker='o', s=100, alpha=0.7, label='Pods')
-
-        # Draw bots (at height 1.0)
-        bot_x = [bot.x for bot in self.instance.bots]
-        bot_y = [bot.y for bot in self.instance.bots]
-        bot_z = [1.0] * len(self.instance.bots)
-
-        # Color based on carrying pod
-        bot_colors = ['red' if bot.carrying_pod else 'green' for bot in self.instance.bots]
-        if bot_x:
-            for i, (x, y, z, color) in enumerate(zip(bot_x, bot_y, bot_z, bot_colors)):
-                self.ax.scatter([x], [y], [z], c=color, marker='s', s=150, alpha=0.9,
-                              label=f'Bot {i} (carrying)' if color == 'red' else f'Bot {i} (idle)' if i == 0 else '')
+        pod_count = len(self.instance.pods)
+        stored = ~self.instance.pod_in_use[:pod_count]
+        pod_x = self.instance.pod_x[:pod_count][stored]
+        pod_y = self.instance.pod_y[:pod_count][stored]
+        if len(pod_x):
+            self.ax.scatter(pod_x, pod_y, np.full(len(pod_x), 0.5), c='blue', marker='o', s=100, alpha=0.7,
+                            label='Pods')
+
+        # Draw bots (at height 1.0), colored by whether they carry a pod
+        bot_count = len(self.instance.bots)
+        if bot_count:
+            bot_x = self.instance.bot_x[:bot_count]
+            bot_y = self.instance.bot_y[:bot_count]
+            bot_colors = np.where(self.instance.bot_pod[:bot_count] >= 0, 'red', 'green')
+            self.ax.scatter(bot_x, bot_y, np.ones(bot_count), c=bot_colors, marker='s', s=150, alpha=0.9)
 
         # Set axis limits
-        width = self.instance.config['warehouse']['width']
-        height = self.instance.config['warehouse']['height']
+        width = self.instance.config.warehouse.width
+        height = self.instance.config.warehouse.height
         self.ax.set_xlim(0, width)
         self.ax.set_ylim(0, height)
         self.ax.set_zlim(0, 2)
 
-        # Add legend (but limit entries)
-        handles, labels = self.ax.get_legend_handles_labels()
-        by_label = dict(zip(labels, handles))
-        self.ax.legend(by_label.values(), by_label.keys(), loc='upper left')
+        # Add legend (bots are one scatter with two colors, so they get proxy entries)
+        handles, _ = self.ax.get_legend_handles_labels()
+        self.ax.legend(handles=handles + self._bot_legend_handles, loc='upper left')
 
         # Set viewing angle
         self.ax.view_init(elev=30, azim=45)
\ No newline at end of file